@@ -1,6 +1,6 @@
-import React, { useState, useEffect, useRef } from 'react';
+import React, { useState, useEffect, useRef, useMemo } from 'react';
 import { Download, Table, Database, BookOpen, Boxes, FolderTree, BarChart3, GitBranch, Cloud, Workflow, Shield, Bot, Code2, X, Search, Command } from 'lucide-react';
-import { findQueryForEntity, hasQueryForEntity } from './utils/queryMatcher';
+import { resolveQueryForEntity } from './utils/queryMatcher';
 import { filterEntities, filterQueries } from './utils/filterData';
 import { generateCSV, downloadCSVFile } from './utils/csvExport';
 import { CopyButton, CellCopyButton } from './components/CopyButton';
@@ -1082,28 +1082,33 @@ export default function App() {
     return () => document.removeEventListener('keydown', handleKeyDown);
   }, []);
 
-  const filteredData = filterEntities(data[activeTab], search);
-  const filteredQueriesData = filterQueries(exampleQueries[activeTab] || [], search);
-  const activeTabQueries = exampleQueries[activeTab] || [];
+  const activeTabQueries = useMemo(() => exampleQueries[activeTab] || [], [activeTab]);
+  // Only re-filter when the tab or search term changes, not on panel open/close
+  const filteredData = useMemo(
+    () => filterEntities(data[activeTab], search),
+    [activeTab, search]
+  );
+  const filteredQueriesData = useMemo(
+    () => filterQueries(activeTabQueries, search),
+    [activeTabQueries, search]
+  );
+
+  // Resolve each entity's related query once per tab; both the Query button
+  // state and the click handler read from here instead of re-matching
+  const entityQueries = useMemo(() => {
+    const matches = new Map();
+    data[activeTab].forEach((row) => {
+      matches.set(row, resolveQueryForEntity(row.entity, row.table, row.exampleQuery, activeTabQueries));
+    });
+    return matches;
+  }, [activeTab, activeTabQueries]);
 
   // Open panel with highlighted query
-  const openQueryForEntity = (entityName, tableName, exampleQuery) => {
-    // If entity has its own exampleQuery field (inline query from data), use that
-    if (exampleQuery) {
-      setHighlightedQuery(exampleQuery);
-    } else {
-      // Find related query from exampleQueries
-      const matchedQuery = findQueryForEntity(entityName, tableName, activeTabQueries);
-      setHighlightedQuery(matchedQuery?.query || null);
-    }
+  const openQueryForEntity = (row) => {
+    setHighlightedQuery(entityQueries.get(row));
     setShowQueries(true);
   };
 
-  // Check if entity has a related query (wrapper using imported utility)
-  const checkHasQueryForEntity = (entityName, tableName, exampleQuery) => {
-    return hasQueryForEntity(entityName, tableName, exampleQuery, activeTabQueries);
-  };
-
   const downloadCSV = () => {
     const cols = columns[activeTab];
     const csv = generateCSV(filteredData, cols, colHeaders);
@@ -1250,8 +1255,8 @@ export default function App() {
                     ))}
                     <td className="px-4 py-3 align-top">
                       <PlayQueryButton 
-                        hasQuery={checkHasQueryForEntity(row.entity, row.table, row.exampleQuery)}
-                        onClick={() => openQueryForEntity(row.entity, row.table, row.exampleQuery)}
+                        hasQuery={entityQueries.get(row) !== null}
+                        onClick={() => openQueryForEntity(row)}
                       />
                     </td>
                   </tr>
@@ -195,6 +195,35 @@ describe('App', () => {
       // The escape key handler is tested at the unit level via the QueryPanel component
       // This integration test verifies the panel opens correctly
     });
+
+    it('shows the clicked entity row inline query in the panel', async () => {
+      const user = userEvent.setup({ advanceTimers: vi.advanceTimersByTime });
+      render(<App />);
+
+      await user.click(screen.getByRole('button', { name: /Glossary/i }));
+
+      // The panel is always mounted, so check for the entity card, not the header
+      expect(screen.queryByText('Entity Example Query')).not.toBeInTheDocument();
+
+      const glossaryRow = screen.getByText('AtlasGlossary').closest('tr');
+      await user.click(within(glossaryRow).getByTitle('View query'));
+
+      expect(screen.getByText('Entity Example Query')).toBeInTheDocument();
+      const shownQuery = screen
+        .getAllByText('SELECT GUID, NAME FROM ATLASGLOSSARY_ENTITY')
+        .filter((el) => el.tagName === 'PRE');
+      expect(shownQuery).toHaveLength(1);
+    });
+
+    it('shows a Query button only for entities with a related query', () => {
+      render(<App />);
+
+      const abstractRow = screen.getByText('Referenceable').closest('tr');
+      expect(within(abstractRow).queryByTitle('View query')).not.toBeInTheDocument();
+
+      const processRow = screen.getByText('Process').closest('tr');
+      expect(within(processRow).getByTitle('View query')).toBeInTheDocument();
+    });
   });
 
   describe('entity count display', () => {
@@ -11,34 +11,56 @@ export function findQueryForEntity(entityName, tableName, queries) {
 
   const tableNameLower = tableName.toLowerCase();
   const entityNameLower = entityName.toLowerCase();
+  // Loop-invariant, so compile once per lookup rather than once per query
+  const standaloneTableRegex = new RegExp(`\\b${tableNameLower}\\b`);
 
-  // Priority 1: Exact table name match in query SQL (e.g., "FROM TABLE_ENTITY" or "TABLE_ENTITY")
-  let matchedQuery = queries.find((q) => {
+  // Single pass: a table-name match (priority 1) wins immediately; otherwise
+  // fall back to the first query whose title names the entity (priority 2)
+  let titleMatch = null;
+  for (const q of queries) {
+    // Priority 1: Exact table name match in query SQL (e.g., "FROM TABLE_ENTITY" or "TABLE_ENTITY")
     const queryLower = q.query.toLowerCase();
-    return (
+    if (
       queryLower.includes(`from ${tableNameLower}`) ||
       queryLower.includes(`from\n    ${tableNameLower}`) ||
       queryLower.includes(`from\n${tableNameLower}`) ||
       queryLower.includes(`join ${tableNameLower}`) ||
       // Also check for the table name as a standalone reference
-      new RegExp(`\\b${tableNameLower.replace(/_/g, '_')}\\b`).test(queryLower)
-    );
-  });
+      standaloneTableRegex.test(queryLower)
+    ) {
+      return q;
+    }
 
-  // Priority 2: Entity name explicitly in title (e.g., "Table" in title for TABLE_ENTITY)
-  if (!matchedQuery) {
-    matchedQuery = queries.find((q) => {
+    // Priority 2: Entity name explicitly in title (e.g., "Table" in title for TABLE_ENTITY)
+    if (!titleMatch) {
       const titleLower = q.title.toLowerCase();
       // Match singular entity name (e.g., "Column" for Column entity, "Table" for Table)
-      return (
+      if (
         titleLower.includes(entityNameLower) ||
         titleLower.includes(entityNameLower + 's') || // plural
         titleLower.includes(entityNameLower + ' ')
-      );
-    });
+      ) {
+        titleMatch = q;
+      }
+    }
   }
 
-  return matchedQuery || null;
+  return titleMatch;
+}
+
+/**
+ * Resolve the SQL to show for an entity: its inline example query if present,
+ * otherwise the related query found by table or entity name
+ * @param {string} entityName - The name of the entity
+ * @param {string} tableName - The database table name
+ * @param {string|undefined} exampleQuery - Inline example query from entity data
+ * @param {Array} queries - Array of query objects
+ * @returns {string|null} Query SQL or null
+ */
+export function resolveQueryForEntity(entityName, tableName, exampleQuery, queries) {
+  if (exampleQuery) return exampleQuery;
+  if (!tableName || tableName === '(abstract)') return null;
+  return findQueryForEntity(entityName, tableName, queries)?.query || null;
 }
 
 /**
@@ -50,7 +72,5 @@ export function findQueryForEntity(entityName, tableName, queries) {
  * @returns {boolean} True if entity has a related query
  */
 export function hasQueryForEntity(entityName, tableName, exampleQuery, queries) {
-  if (exampleQuery) return true;
-  if (!tableName || tableName === '(abstract)') return false;
-  return findQueryForEntity(entityName, tableName, queries) !== null;
+  return resolveQueryForEntity(entityName, tableName, exampleQuery, queries) !== null;
 }
@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { findQueryForEntity, hasQueryForEntity } from './queryMatcher';
+import { findQueryForEntity, resolveQueryForEntity, hasQueryForEntity } from './queryMatcher';
 
 const mockQueries = [
   {
@@ -73,6 +73,25 @@ describe('findQueryForEntity', () => {
       expect(result).not.toBeNull();
       expect(result.title).toBe('List All Columns');
     });
+
+    it('matches FROM/JOIN prefixes even when the name continues', () => {
+      // No word boundary after TABLE_ENTITY here, so only the FROM/JOIN checks can match
+      const fromQueries = [
+        { title: 'Versioned Tables', description: 'Suffixed table', query: 'SELECT * FROM TABLE_ENTITY2' },
+      ];
+      const joinQueries = [
+        { title: 'Versioned Join', description: 'Suffixed join', query: 'SELECT * FROM X JOIN TABLE_ENTITY_V2 t' },
+      ];
+      expect(findQueryForEntity('Asset', 'TABLE_ENTITY', fromQueries)?.title).toBe('Versioned Tables');
+      expect(findQueryForEntity('Asset', 'TABLE_ENTITY', joinQueries)?.title).toBe('Versioned Join');
+    });
+
+    it('does not match a table name embedded in a longer identifier', () => {
+      const embeddedQueries = [
+        { title: 'Other', description: 'Embedded name', query: 'SELECT MYTABLE_ENTITY2 FROM X' },
+      ];
+      expect(findQueryForEntity('Asset', 'TABLE_ENTITY', embeddedQueries)).toBeNull();
+    });
   });
 
   describe('falls back to entity name in title', () => {
@@ -101,6 +120,24 @@ describe('findQueryForEntity', () => {
       expect(result).not.toBeNull();
       expect(result.title).toBe('List All Columns');
     });
+
+    it('prefers a later table name match over an earlier title match', () => {
+      const queriesWithBoth = [
+        {
+          title: 'Column Overview',
+          description: 'Mentions the entity only in its title',
+          query: 'SELECT * FROM UNRELATED_TABLE',
+        },
+        {
+          title: 'Data Types',
+          description: 'Queries the entity table directly',
+          query: 'SELECT NAME FROM COLUMN_ENTITY',
+        },
+      ];
+      const result = findQueryForEntity('Column', 'COLUMN_ENTITY', queriesWithBoth);
+      expect(result).not.toBeNull();
+      expect(result.title).toBe('Data Types');
+    });
   });
 
   describe('returns null when no match found', () => {
@@ -111,6 +148,34 @@ describe('findQueryForEntity', () => {
   });
 });
 
+describe('resolveQueryForEntity', () => {
+  it('returns the inline exampleQuery when provided', () => {
+    expect(resolveQueryForEntity('Entity', 'TABLE', 'SELECT 1', mockQueries)).toBe('SELECT 1');
+  });
+
+  it('prefers the inline exampleQuery over a matching query', () => {
+    expect(resolveQueryForEntity('Table', 'TABLE_ENTITY', 'SELECT 1', mockQueries)).toBe('SELECT 1');
+  });
+
+  it('returns the matched query SQL when there is no inline query', () => {
+    expect(resolveQueryForEntity('Column', 'COLUMN_ENTITY', undefined, mockQueries)).toBe(
+      mockQueries[1].query
+    );
+  });
+
+  it('returns null for abstract entities', () => {
+    expect(resolveQueryForEntity('Asset', '(abstract)', undefined, mockQueries)).toBeNull();
+  });
+
+  it('returns null when tableName is null', () => {
+    expect(resolveQueryForEntity('Entity', null, undefined, mockQueries)).toBeNull();
+  });
+
+  it('returns null when no matching query found', () => {
+    expect(resolveQueryForEntity('Random', 'RANDOM_TABLE', undefined, mockQueries)).toBeNull();
+  });
+});
+
 describe('hasQueryForEntity', () => {
   describe('returns true when query exists', () => {
     it('returns true when exampleQuery is provided', () => {